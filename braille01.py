@@ -7,9 +7,41 @@ A beginner-friendly Braille autocorrect system for QWERTY keyboard input.
 Focuses on clear, readable code with essential features.
 """
 
+import heapq
 import json
+import os
+import pickle
+import re
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
+# rapidfuzz is optional: it computes edit distances in C, much faster
+# than the pure Python fallback used when it is not installed
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    process = None
+    Levenshtein = None
+
+# numpy is optional: together with rapidfuzz or numba, it lets
+# find_suggestions_batch check many words against the whole dictionary
+# in one step
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# numba is optional too: without rapidfuzz, it compiles the batch edit
+# distance loop to machine code
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = None
+
 # Map QWERTY keys to Braille dots
 BRAILLE_KEYS = {
     'D': 1, 'W': 2, 'Q': 3,  # Left side dots
@@ -26,151 +58,564 @@ DOT_TO_LETTER = {
     (1, 3, 5, 6): 'z'
 }
 
+# Common English words every dictionary starts with
+BASIC_WORDS = (
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had',
+    'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his',
+    'how', 'man', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy',
+    'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use', 'good', 'have',
+    'just', 'like', 'over', 'also', 'back', 'call', 'came', 'each', 'find',
+    'give', 'hand', 'here', 'keep', 'kind', 'know', 'last', 'left', 'life',
+    'live', 'look', 'made', 'make', 'most', 'move', 'must', 'name', 'need',
+    'only', 'open', 'part', 'play', 'right', 'said', 'same', 'seem', 'show',
+    'side', 'take', 'tell', 'turn', 'want', 'well', 'went', 'were', 'what',
+    'when', 'where', 'which', 'will', 'with', 'word', 'work', 'world', 'year',
+    'hello', 'computer', 'braille', 'system', 'keyboard', 'typing', 'input'
+)
+
+# Where the dictionary built from BASIC_WORDS is saved between runs
+DICTIONARY_CACHE = os.path.join(os.path.expanduser('~'), '.braille_dict.pkl')
+# Bump when the saved data changes shape, so old caches are rebuilt
+CACHE_VERSION = 6
+
+# Finds any Braille key, in either case. U+1E98 (w with ring above)
+# uppercases to W plus a combining ring, so it counts as a key too.
+BRAILLE_KEY_PATTERN = re.compile('[DWQKOPdwqkop\u1e98]')
+
+# Most edits a suggestion may be away from the typed word
+MAX_EDIT_DISTANCE = 3
+
+# Only this many leading letters of a word go into the delete index, which
+# keeps the index and each lookup small however long the word is
+PREFIX_LENGTH = 7
+
+# Removes every non-letter in the first 256 characters with str.translate
+NON_LETTERS = {code: None for code in range(256) if not chr(code).isalpha()}
+
+# Each dot as a single bit (dot 1 is bit 0, ..., dot 6 is bit 5)
+KEY_TO_BIT = {key: 1 << (dot - 1) for key, dot in BRAILLE_KEYS.items()}
+
+# Letter for every possible combination of the six dots (None if unused)
+BITMASK_TO_LETTER = [None] * 64
+for _pattern, _letter in DOT_TO_LETTER.items():
+    BITMASK_TO_LETTER[sum(1 << (dot - 1) for dot in _pattern)] = _letter
+
+# Byte tables for converting Braille input a whole string at a time:
+# the dot bit for each Braille key (either case, 0 for any other byte),
+# the letter byte for each dot bitmask, and ASCII lowercasing
+_BYTE_TO_BIT = bytearray(256)
+for _key, _bit in KEY_TO_BIT.items():
+    _BYTE_TO_BIT[ord(_key)] = _bit
+    _BYTE_TO_BIT[ord(_key.lower())] = _bit
+_BITMASK_TO_BYTE = bytes(ord(letter or '?') for letter in BITMASK_TO_LETTER)
+_LOWER_BYTES = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz')
+
+if njit is not None:
+    @njit(cache=True)
+    def _lev(a, b, max_distance):
+        """Edit distance between two encoded words, capped at max_distance + 1"""
+        if len(a) < len(b):
+            a, b = b, a
+        too_far = max_distance + 1
+        if len(a) - len(b) > max_distance:
+            return too_far
+        
+        prev = np.empty(len(b) + 1, dtype=np.int32)
+        cur = np.empty(len(b) + 1, dtype=np.int32)
+        for j in range(len(b) + 1):
+            prev[j] = j
+        
+        for i in range(1, len(a) + 1):
+            cur[0] = i
+            row_min = i
+            for j in range(1, len(b) + 1):
+                cost = 0 if a[i-1] == b[j-1] else 1
+                cur[j] = min(prev[j] + 1, cur[j-1] + 1, prev[j-1] + cost)
+                if cur[j] < row_min:
+                    row_min = cur[j]
+            if row_min > max_distance:
+                return too_far
+            prev, cur = cur, prev
+        
+        return min(prev[len(b)], too_far)
+    
+    @njit(parallel=True, cache=True)
+    def _batch_lev(queries, query_lens, max_distances, first_rows, end_rows,
+                   dict_arr, dict_lens, out):
+        """Fill out[q, row] with _lev between query q and dictionary row
+        
+        Only rows from first_rows[q] up to end_rows[q] are compared; the rest
+        are left as they are. Dictionary rows are split across CPU cores.
+        """
+        for row in prange(len(dict_lens)):
+            word = dict_arr[row, :dict_lens[row]]
+            for q in range(len(query_lens)):
+                if first_rows[q] <= row < end_rows[q]:
+                    out[q, row] = _lev(queries[q, :query_lens[q]], word, max_distances[q])
+else:
+    _lev = None
+    _batch_lev = None
+
+
+def _myers(pattern, text):
+    """Edit distance using Myers' bit-parallel algorithm
+    
+    Each bit of the integers below stands for one letter of pattern, so a
+    whole column of the edit distance table is updated with a handful of
+    integer operations instead of one cell at a time.
+    """
+    if not pattern:
+        return len(text)
+    
+    # Bit mask of the positions where each letter appears in pattern
+    positions = {}
+    for i, letter in enumerate(pattern):
+        positions[letter] = positions.get(letter, 0) | (1 << i)
+    
+    mask = (1 << len(pattern)) - 1
+    last_bit = 1 << (len(pattern) - 1)
+    # Bits set where the distance goes up (plus) or down (minus) by one
+    # from one row of the column to the next
+    plus, minus = mask, 0
+    distance = len(pattern)
+    
+    for letter in text:
+        matches = positions.get(letter, 0)
+        vertical = matches | minus
+        horizontal = (((matches & plus) + plus) ^ plus) | matches
+        h_plus = minus | (~(horizontal | plus) & mask)
+        h_minus = plus & horizontal
+        
+        if h_plus & last_bit:
+            distance += 1
+        elif h_minus & last_bit:
+            distance -= 1
+        
+        h_plus = ((h_plus << 1) | 1) & mask
+        h_minus = (h_minus << 1) & mask
+        plus = h_minus | (~(vertical | h_plus) & mask)
+        minus = h_plus & vertical
+    
+    return distance
+
+
+def _encode(word):
+    """Encode a word as an array of character codes for _lev"""
+    return np.frombuffer(word.encode('utf-32-le'), dtype=np.uint32)
+
+
+def _encode_all(words):
+    """Encode words as rows of a zero-padded array, plus their lengths"""
+    lengths = np.array([len(word) for word in words], dtype=np.int64)
+    array = np.zeros((len(words), max(lengths, default=0)), dtype=np.uint32)
+    for row, word in enumerate(words):
+        array[row, :len(word)] = _encode(word)
+    return array, lengths
+
+
+def _max_distance(word):
+    """How many edits a suggestion for word may be away"""
+    return min(MAX_EDIT_DISTANCE, len(word) // 2 + 1)  # Allow more errors for longer words
+
+
+def _deletes(word, max_deletes):
+    """List word and every string made by deleting up to max_deletes letters"""
+    found = {word: None}
+    shorter_words = [word]
+    for _ in range(max_deletes):
+        next_words = []
+        for current in shorter_words:
+            for i in range(len(current)):
+                shorter = current[:i] + current[i+1:]
+                if shorter not in found:
+                    found[shorter] = None
+                    next_words.append(shorter)
+        shorter_words = next_words
+    return list(found)
+
+
 class SimpleBrailleAutocorrect:
     """Simple Braille autocorrect with basic features"""
     
-    def __init__(self):
+    __slots__ = ('dictionary', 'word_count', 'freq_score', 'learned_fixes', 'by_length',
+                 'delete_index', 'dict_version', '_cached_suggestions',
+                 '_batch_arrays', '_batch_version')
+    
+    def __init__(self, cache_path=DICTIONARY_CACHE):
+        """Set up the dictionary
+        
+        The dictionary built from BASIC_WORDS is saved to cache_path and
+        loaded from there next time, which makes startup faster. Pass
+        cache_path=None to always build it from scratch.
+        """
         # Dictionary of valid words
         self.dictionary = set()
         # Track word usage for better suggestions
-        self.word_count = {}
+        self.word_count = Counter()
+        # Each word's share of the suggestion score from its usage
+        self.freq_score = {}
         # Remember user corrections
         self.learned_fixes = {}
+        # Dictionary words grouped by length
+        self.by_length = defaultdict(list)
+        # Every string made by deleting up to MAX_EDIT_DISTANCE letters
+        # from the start of a dictionary word -> the words it came from
+        self.delete_index = {}
+        # Bumped whenever the words change, so cached suggestions from
+        # before the change are never reused
+        self.dict_version = 0
+        # Remember recent searches for repeated misspellings
+        self._cached_suggestions = lru_cache(maxsize=4096)(self._search_suggestions)
+        # Dictionary as padded arrays for batch checks, built when first
+        # needed and rebuilt once dict_version moves on
+        self._batch_arrays = None
+        self._batch_version = -1
         
-        # Add common English words
-        self.load_basic_words()
+        # Add common English words, reusing the saved copy if there is one
+        if not self._load_cache(cache_path):
+            self.load_basic_words()
+            self._save_cache(cache_path)
     
     def load_basic_words(self):
         """Load common English words into dictionary"""
-        words = [
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had',
-            'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his',
-            'how', 'man', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy',
-            'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use', 'good', 'have',
-            'just', 'like', 'over', 'also', 'back', 'call', 'came', 'each', 'find',
-            'give', 'hand', 'here', 'keep', 'kind', 'know', 'last', 'left', 'life',
-            'live', 'look', 'made', 'make', 'most', 'move', 'must', 'name', 'need',
-            'only', 'open', 'part', 'play', 'right', 'said', 'same', 'seem', 'show',
-            'side', 'take', 'tell', 'turn', 'want', 'well', 'went', 'were', 'what',
-            'when', 'where', 'which', 'will', 'with', 'word', 'work', 'world', 'year',
-            'hello', 'computer', 'braille', 'system', 'keyboard', 'typing', 'input'
-        ]
-        
-        for word in words:
+        for word in BASIC_WORDS:
             self.add_word(word)
     
+    def _load_cache(self, cache_path):
+        """Load the saved basic dictionary, returning True if it worked"""
+        if cache_path is None:
+            return False
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                (version, saved_words, prefix_length, max_edit_distance, dictionary,
+                 word_count, freq_score, by_length, delete_index) = pickle.load(f)
+        except Exception:
+            # A missing or unreadable cache just means building from scratch
+            return False
+        
+        # The word list, the data layout or the delete index settings have
+        # changed since it was saved
+        if version != CACHE_VERSION or saved_words != BASIC_WORDS:
+            return False
+        if (prefix_length, max_edit_distance) != (PREFIX_LENGTH, MAX_EDIT_DISTANCE):
+            return False
+        
+        # Unpickled strings are fresh copies, so intern them again
+        self.dictionary = {sys.intern(word) for word in dictionary}
+        self.word_count = word_count
+        self.freq_score = freq_score
+        self.by_length = by_length
+        self.delete_index = delete_index
+        return True
+    
+    def _save_cache(self, cache_path):
+        """Save the basic dictionary so the next start can skip building it"""
+        if cache_path is None:
+            return
+        
+        state = (CACHE_VERSION, BASIC_WORDS, PREFIX_LENGTH, MAX_EDIT_DISTANCE,
+                 self.dictionary, self.word_count, self.freq_score, self.by_length,
+                 self.delete_index)
+        temp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=5)
+            # Replace the old cache in one step so readers never see half a file
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # Not being able to save is fine, the next start just rebuilds
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
     def add_word(self, word):
         """Add a word to the dictionary"""
-        word = word.lower().strip()
+        # Interned words compare by identity in the dictionary checks
+        word = sys.intern(word.lower().strip())
         if word:
-            self.dictionary.add(word)
-            self.word_count[word] = self.word_count.get(word, 0) + 1
+            if word not in self.dictionary:
+                self.dictionary.add(word)
+                self.by_length[len(word)].append(word)
+                for variant in _deletes(word[:PREFIX_LENGTH], MAX_EDIT_DISTANCE):
+                    self.delete_index.setdefault(variant, []).append(word)
+            self.word_count[word] += 1
+            self.freq_score[word] = self.word_count[word] / 100 * 0.3
+            self.dict_version += 1
     
     def convert_braille_input(self, input_text):
         """Convert QWERTY Braille input to regular text"""
-        result = []
-        current_dots = set()
+        # Non-ASCII text needs the full Unicode case rules, so uppercase it
+        # first like the keys expect; plain ASCII is handled by the tables
+        is_ascii = input_text.isascii()
+        text = input_text if is_ascii else input_text.upper()
         
-        for char in input_text.upper():
-            if char == ' ':
-                # End of character, convert dots to letter
-                if current_dots:
-                    letter = self.dots_to_letter(current_dots)
-                    result.append(letter)
-                    current_dots = set()
-                result.append(' ')
-            elif char in BRAILLE_KEYS:
+        result = bytearray()
+        # Dots pressed for the current character, one bit per dot
+        current_dots = 0
+        
+        # Local names are faster to look up inside the loop
+        to_bit = _BYTE_TO_BIT
+        to_letter = _BITMASK_TO_BYTE
+        lower = _LOWER_BYTES
+        append = result.append
+        
+        for byte in text.encode('utf-8', 'surrogatepass'):
+            bit = to_bit[byte]
+            if bit:
                 # Add dot to current character
-                current_dots.add(BRAILLE_KEYS[char])
+                current_dots |= bit
             else:
-                # Regular character, add as-is
+                # Space or regular character ends the current character,
+                # then is added as-is
                 if current_dots:
-                    letter = self.dots_to_letter(current_dots)
-                    result.append(letter)
-                    current_dots = set()
-                result.append(char.lower())
+                    append(to_letter[current_dots])
+                    current_dots = 0
+                append(lower[byte])
         
         # Handle any remaining dots
         if current_dots:
-            letter = self.dots_to_letter(current_dots)
-            result.append(letter)
+            append(to_letter[current_dots])
         
-        return ''.join(result)
+        output = result.decode('utf-8', 'surrogatepass')
+        if not is_ascii:
+            output = ''.join(char.lower() for char in output)
+        return output
     
     def dots_to_letter(self, dots):
         """Convert set of dots to a letter"""
-        dot_pattern = tuple(sorted(dots))
-        return DOT_TO_LETTER.get(dot_pattern, '?')
+        bitmask = 0
+        for dot in dots:
+            # Dots outside the cell and repeated dots are not a letter
+            if not 1 <= dot <= 6 or bitmask & (1 << (dot - 1)):
+                return '?'
+            bitmask |= 1 << (dot - 1)
+        return BITMASK_TO_LETTER[bitmask] or '?'
     
-    def calculate_similarity(self, word1, word2):
-        """Calculate how similar two words are (simple version)"""
+    def calculate_similarity(self, word1, word2, max_distance=None):
+        """Calculate how similar two words are (simple version)
+        
+        If max_distance is given, any distance above it is reported as
+        max_distance + 1, which lets the calculation stop early.
+        """
         if word1 == word2:
             return 0
         
-        # Simple edit distance calculation
+        if Levenshtein is not None:
+            return Levenshtein.distance(word1, word2, score_cutoff=max_distance)
+        
+        # Make word1 the longer word so the rows are as short as possible
+        if len(word1) < len(word2):
+            word1, word2 = word2, word1
         len1, len2 = len(word1), len(word2)
         
-        # Create a matrix to store distances
-        matrix = [[0] * (len2 + 1) for _ in range(len1 + 1)]
+        # Without a limit, the band below covers the whole table
+        limit = len1 if max_distance is None else max_distance
+        too_far = limit + 1
         
-        # Fill first row and column
-        for i in range(len1 + 1):
-            matrix[i][0] = i
-        for j in range(len2 + 1):
-            matrix[0][j] = j
+        # Every extra letter costs at least one edit
+        if len1 - len2 > limit:
+            return too_far
         
-        # Fill the matrix
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                if word1[i-1] == word2[j-1]:
-                    cost = 0
-                else:
-                    cost = 1
-                
-                matrix[i][j] = min(
-                    matrix[i-1][j] + 1,      # deletion
-                    matrix[i][j-1] + 1,      # insertion
-                    matrix[i-1][j-1] + cost  # substitution
+        # Words up to 64 letters fit in one machine word for the
+        # bit-parallel version, which is much faster in Python
+        if len2 <= 64:
+            return min(_myers(word2, word1), too_far)
+        
+        # Edit distance keeping only the previous and current rows.
+        # Only cells within `limit` of the diagonal can stay under the
+        # limit, so everything outside that band is treated as too far.
+        prev = [j if j <= limit else too_far for j in range(len2 + 1)]
+        cur = [too_far] * (len2 + 1)
+        
+        for i, char1 in enumerate(word1, 1):
+            start = max(1, i - limit)
+            end = min(len2, i + limit)
+            
+            cur[0] = i if i <= limit else too_far
+            if start > 1:
+                cur[start-1] = too_far
+            row_min = cur[start-1]
+            
+            for j in range(start, end + 1):
+                cost = 0 if char1 == word2[j-1] else 1
+                cur[j] = min(
+                    prev[j] + 1,        # deletion
+                    cur[j-1] + 1,       # insertion
+                    prev[j-1] + cost    # substitution
                 )
+                if cur[j] < row_min:
+                    row_min = cur[j]
+            if end < len2:
+                cur[end+1] = too_far
+            
+            # Distances never shrink from one row to the next
+            if row_min > limit:
+                return too_far
+            prev, cur = cur, prev
         
-        return matrix[len1][len2]
+        return min(prev[-1], too_far)
     
     def find_suggestions(self, word, max_suggestions=5):
         """Find suggestions for a misspelled word"""
-        word = word.lower()
+        word = sys.intern(word.lower())
+        
+        # Known and learned words are answered straight away, so the cache
+        # only holds real searches
+        known = self._known_suggestion(word)
+        if known is not None:
+            return known
         
+        suggestions = self._cached_suggestions(word, max_suggestions, self.dict_version)
+        return list(suggestions)
+    
+    def _known_suggestion(self, word):
+        """Suggestion for a dictionary word or learned fix, or None"""
         # If word is in dictionary, return it
         if word in self.dictionary:
             return [word]
         
         # Check if we've learned a fix for this word
-        if word in self.learned_fixes:
-            return [self.learned_fixes[word]]
+        fix = self.learned_fixes.get(word)
+        if fix is not None:
+            return [fix]
+        
+        return None
+    
+    def _search_suggestions(self, word, max_suggestions, dict_version):
+        """Search suggestions for a lowercase word (cached by find_suggestions)
         
-        # Find similar words
+        dict_version is not used here; it is part of the cache key so that
+        results are recalculated after the dictionary changes.
+        """
+        close_words = self._close_words(word, _max_distance(word))
+        return self._rank_suggestions(word, close_words, max_suggestions)
+    
+    def _rank_suggestions(self, word, close_words, max_suggestions):
+        """Pick the best (word, distance) candidates, returning just the words"""
         suggestions = []
-        max_distance = min(3, len(word) // 2 + 1)  # Allow more errors for longer words
+        word_length = len(word)
+        freq_score = self.freq_score
         
-        for dict_word in self.dictionary:
-            distance = self.calculate_similarity(word, dict_word)
-            if distance <= max_distance:
-                # Calculate score based on similarity and word frequency
-                similarity_score = 1.0 - (distance / max(len(word), len(dict_word)))
-                frequency_score = self.word_count.get(dict_word, 1)
-                total_score = similarity_score * 0.7 + (frequency_score / 100) * 0.3
-                
-                suggestions.append((dict_word, total_score, distance))
+        for dict_word, distance in close_words:
+            # Calculate score based on similarity and word frequency
+            similarity_score = 1.0 - (distance / max(word_length, len(dict_word)))
+            total_score = similarity_score * 0.7 + freq_score[dict_word]
+            
+            suggestions.append((dict_word, total_score, distance))
         
-        # Sort by score (higher is better)
-        suggestions.sort(key=lambda x: x[1], reverse=True)
+        # Keep only the best scores (higher is better). Equal scores go to
+        # the closer word, then alphabetical order, so the result does not
+        # depend on the order the candidates were found in.
+        best = heapq.nsmallest(max_suggestions, suggestions,
+                               key=lambda x: (-x[1], x[2], x[0]))
         
         # Return just the words
-        return [word for word, score, distance in suggestions[:max_suggestions]]
+        return tuple(word for word, score, distance in best)
+    
+    def _close_words(self, word, max_distance):
+        """Find dictionary words within max_distance edits of word
+        
+        Returns a list of (word, distance) tuples.
+        """
+        # Every dictionary word is too short to be within reach
+        if len(word) - max_distance > max(self.by_length, default=0):
+            return []
+        
+        # Symmetric delete search: if a dictionary word is within
+        # max_distance edits, deleting at most max_distance letters from
+        # the starts of both words leads to the same string. The delete
+        # index maps those strings back to dictionary words, so only the
+        # words it finds need a real distance check, however big the
+        # dictionary is.
+        found = []
+        seen = set()
+        originals = self.delete_index.get
+        distance_to = self.calculate_similarity
+        
+        for variant in _deletes(word[:PREFIX_LENGTH], max_distance):
+            for dict_word in originals(variant, ()):
+                if dict_word not in seen:
+                    seen.add(dict_word)
+                    distance = distance_to(word, dict_word, max_distance)
+                    if distance <= max_distance:
+                        found.append((dict_word, distance))
+        
+        return found
+    
+    def find_suggestions_batch(self, words, max_suggestions=5):
+        """Find suggestions for many words at once
+        
+        Returns a dict from each lowercase word to its suggestions. With
+        numpy and rapidfuzz or numba installed, all words that need a
+        search are compared with the dictionary in one compiled step. This
+        skips the suggestion cache, so it is meant for long lists of
+        different words checked once; autocorrect goes word by word, which
+        lets repeated words come from the cache.
+        """
+        words = dict.fromkeys(sys.intern(word.lower()) for word in words)
+        
+        # Without a compiled backend, the per-word search is faster
+        if np is None or (process is None and _batch_lev is None):
+            return {word: self.find_suggestions(word, max_suggestions) for word in words}
+        
+        results = {}
+        pending = []
+        
+        for word in words:
+            known = self._known_suggestion(word)
+            if known is not None:
+                results[word] = known
+            else:
+                pending.append(word)
+        
+        if pending:
+            for word, close_words in zip(pending, self._close_words_batch(pending)):
+                results[word] = list(self._rank_suggestions(word, close_words, max_suggestions))
+        
+        return results
+    
+    def _close_words_batch(self, words):
+        """Find close dictionary words for each word, like _close_words
+        
+        Needs numpy and either rapidfuzz or numba.
+        """
+        if self._batch_version != self.dict_version:
+            # Sort rows by length so each word's usable lengths are one slice
+            dict_words = [dict_word for length in sorted(self.by_length)
+                          for dict_word in self.by_length[length]]
+            self._batch_arrays = (dict_words,) + _encode_all(dict_words)
+            self._batch_version = self.dict_version
+        dict_words, dict_arr, dict_lens = self._batch_arrays
+        
+        max_distances = np.array([_max_distance(word) for word in words], dtype=np.int64)
+        word_lens = np.array([len(word) for word in words], dtype=np.int64)
+        first_rows = np.searchsorted(dict_lens, word_lens - max_distances, side='left')
+        end_rows = np.searchsorted(dict_lens, word_lens + max_distances, side='right')
+        
+        if process is not None:
+            # rapidfuzz compares every pair in C, spread over all CPU cores
+            distances = process.cdist(words, dict_words, scorer=Levenshtein.distance,
+                                      score_cutoff=int(max_distances.max()), workers=-1)
+        else:
+            queries, query_lens = _encode_all(words)
+            distances = np.full((len(words), len(dict_words)), max_distances.max() + 1,
+                                dtype=np.int64)
+            _batch_lev(queries, query_lens, max_distances, first_rows, end_rows,
+                       dict_arr, dict_lens, distances)
+        
+        found = []
+        for q in range(len(words)):
+            first, end = first_rows[q], end_rows[q]
+            close = np.flatnonzero(distances[q, first:end] <= max_distances[q]) + first
+            found.append([(dict_words[row], int(distances[q, row])) for row in close])
+        return found
     
     def autocorrect(self, text, max_suggestions=3):
         """Main autocorrect function"""
         # Convert Braille input if needed
-        if any(c in 'DWQKOP' for c in text.upper()):
+        if BRAILLE_KEY_PATTERN.search(text):
             text = self.convert_braille_input(text)
         
         # Process each word
@@ -179,7 +624,10 @@ class SimpleBrailleAutocorrect:
         
         for word in words:
             # Clean the word (remove punctuation for checking)
-            clean_word = ''.join(c for c in word if c.isalpha())
+            clean_word = word.translate(NON_LETTERS)
+            if clean_word and not clean_word.isalpha():
+                # Rare symbols beyond the table, check each character
+                clean_word = ''.join(c for c in clean_word if c.isalpha())
             
             if clean_word:
                 suggestions = self.find_suggestions(clean_word, max_suggestions)
@@ -220,8 +668,7 @@ class SimpleBrailleAutocorrect:
         return {
             'total_words': len(self.dictionary),
             'learned_corrections': len(self.learned_fixes),
-            'most_common_words': sorted(self.word_count.items(), 
-                                      key=lambda x: x[1], reverse=True)[:5]
+            'most_common_words': self.word_count.most_common(5)
         }
 
 def demo():
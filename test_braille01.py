@@ -0,0 +1,319 @@
+"""Tests for SimpleBrailleAutocorrect"""
+
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import braille01
+from braille01 import SimpleBrailleAutocorrect, BASIC_WORDS
+
+
+def make_typos(count=300, seed=0):
+    """Misspell random basic words with a few random edits"""
+    rng = random.Random(seed)
+    typos = []
+    for _ in range(count):
+        letters = list(rng.choice(BASIC_WORDS))
+        for _ in range(rng.randint(1, 3)):
+            position = rng.randrange(len(letters) + 1)
+            letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+            if position == len(letters) or rng.random() < 0.3:
+                letters.insert(position, letter)
+            else:
+                letters[position] = letter
+        typos.append(''.join(letters))
+    return typos
+
+
+def plain_distance(word1, word2):
+    """Edit distance from the full table, as a reference"""
+    table = [[i + j if i == 0 or j == 0 else 0 for j in range(len(word2) + 1)]
+             for i in range(len(word1) + 1)]
+    for i in range(1, len(word1) + 1):
+        for j in range(1, len(word2) + 1):
+            cost = 0 if word1[i-1] == word2[j-1] else 1
+            table[i][j] = min(table[i-1][j] + 1, table[i][j-1] + 1, table[i-1][j-1] + cost)
+    return table[-1][-1]
+
+
+def random_word(rng, length, letters='abc'):
+    return ''.join(rng.choice(letters) for _ in range(length))
+
+
+def edit(rng, word, edits):
+    """Apply a few random insertions, deletions and substitutions"""
+    letters = list(word)
+    for _ in range(edits):
+        position = rng.randrange(len(letters) + 1)
+        change = rng.randrange(3)
+        if change == 0 or position == len(letters):
+            letters.insert(position, rng.choice('abc'))
+        elif change == 1:
+            del letters[position]
+        else:
+            letters[position] = rng.choice('abc')
+    return ''.join(letters)
+
+
+class EditDistanceTest(unittest.TestCase):
+    """The pure Python distances, used when rapidfuzz is not installed"""
+    
+    def setUp(self):
+        self.autocorrect = SimpleBrailleAutocorrect(cache_path=None)
+        patcher = mock.patch.object(braille01, 'Levenshtein', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def check(self, word1, word2, max_distance):
+        expected = plain_distance(word1, word2)
+        if max_distance is not None:
+            expected = min(expected, max_distance + 1)
+        self.assertEqual(self.autocorrect.calculate_similarity(word1, word2, max_distance),
+                         expected, (word1, word2, max_distance))
+    
+    def test_myers(self):
+        rng = random.Random(2)
+        for _ in range(2000):
+            pattern = random_word(rng, rng.randint(0, 12))
+            text = random_word(rng, rng.randint(0, 12))
+            self.assertEqual(braille01._myers(pattern, text), plain_distance(pattern, text),
+                             (pattern, text))
+        # Patterns filling all 64 bits
+        for _ in range(50):
+            pattern = random_word(rng, 64)
+            text = edit(rng, pattern, rng.randint(0, 6))
+            self.assertEqual(braille01._myers(pattern, text), plain_distance(pattern, text),
+                             (pattern, text))
+    
+    def test_short_words(self):
+        rng = random.Random(3)
+        for _ in range(2000):
+            word1 = random_word(rng, rng.randint(0, 9))
+            word2 = random_word(rng, rng.randint(0, 9))
+            self.check(word1, word2, rng.choice([None, 0, 1, 2, 3]))
+    
+    def test_long_words(self):
+        # Both words over 64 letters use the banded two-row version
+        rng = random.Random(4)
+        for _ in range(100):
+            word1 = random_word(rng, rng.randint(65, 80))
+            word2 = edit(rng, word1, rng.randint(0, 5))
+            if len(word2) > 64:
+                self.check(word1, word2, rng.choice([None, 0, 1, 2, 3]))
+
+
+class DotsToLetterTest(unittest.TestCase):
+    def setUp(self):
+        self.autocorrect = SimpleBrailleAutocorrect(cache_path=None)
+    
+    def test_letters(self):
+        self.assertEqual(self.autocorrect.dots_to_letter({1}), 'a')
+        self.assertEqual(self.autocorrect.dots_to_letter([4, 1, 3]), 'm')
+        self.assertEqual(self.autocorrect.dots_to_letter(set()), '?')
+    
+    def test_invalid_dots(self):
+        self.assertEqual(self.autocorrect.dots_to_letter({1, 7}), '?')
+        self.assertEqual(self.autocorrect.dots_to_letter({0}), '?')
+        self.assertEqual(self.autocorrect.dots_to_letter([1, 1]), '?')
+
+
+class BrailleKeyPatternTest(unittest.TestCase):
+    def test_matches_uppercased_keys(self):
+        # Same decision as looking for a key in the uppercased text
+        for code in range(0x110000):
+            char = chr(code)
+            has_key = any(key in char.upper() for key in braille01.BRAILLE_KEYS)
+            self.assertEqual(bool(braille01.BRAILLE_KEY_PATTERN.search(char)), has_key,
+                             hex(code))
+
+
+class DictionaryCacheTest(unittest.TestCase):
+    """The basic dictionary is saved once and reused while it matches"""
+    
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_path = os.path.join(temp_dir.name, 'dict.pkl')
+    
+    def build(self):
+        """Make an instance, returning it and whether it built the words"""
+        with mock.patch.object(SimpleBrailleAutocorrect, 'load_basic_words',
+                               autospec=True,
+                               side_effect=SimpleBrailleAutocorrect.load_basic_words) as load:
+            autocorrect = SimpleBrailleAutocorrect(cache_path=self.cache_path)
+        return autocorrect, load.called
+    
+    def test_saved_dictionary_is_reused(self):
+        first, built = self.build()
+        self.assertTrue(built)
+        self.assertTrue(os.path.exists(self.cache_path))
+        
+        second, built = self.build()
+        self.assertFalse(built)
+        self.assertEqual(second.dictionary, first.dictionary)
+        self.assertEqual(second.word_count, first.word_count)
+        self.assertEqual(second.delete_index, first.delete_index)
+        self.assertEqual(second.find_suggestions('wrold'), first.find_suggestions('wrold'))
+    
+    def test_stale_version_is_rebuilt(self):
+        self.build()
+        with open(self.cache_path, 'rb') as f:
+            state = pickle.load(f)
+        with open(self.cache_path, 'wb') as f:
+            pickle.dump((braille01.CACHE_VERSION - 1,) + state[1:], f)
+        
+        autocorrect, built = self.build()
+        self.assertTrue(built)
+        self.assertEqual(autocorrect.find_suggestions('helo')[0], 'hello')
+        # The rebuilt dictionary replaces the stale file
+        self.assertFalse(self.build()[1])
+    
+    def test_changed_delete_index_settings_are_rebuilt(self):
+        self.build()
+        for name, value in [('PREFIX_LENGTH', 4), ('MAX_EDIT_DISTANCE', 2)]:
+            with self.subTest(name), mock.patch.object(braille01, name, value):
+                autocorrect, built = self.build()
+                self.assertTrue(built)
+                self.assertEqual(autocorrect.find_suggestions('commuter')[0], 'computer')
+    
+    def test_corrupt_file_is_rebuilt(self):
+        with open(self.cache_path, 'wb') as f:
+            f.write(b'not a pickle')
+        
+        autocorrect, built = self.build()
+        self.assertTrue(built)
+        self.assertEqual(autocorrect.find_suggestions('helo')[0], 'hello')
+    
+    def test_unwritable_path_still_works(self):
+        # The folder the cache would go in does not exist
+        temp_dir = os.path.dirname(self.cache_path)
+        self.cache_path = os.path.join(temp_dir, 'missing', 'dict.pkl')
+        autocorrect, built = self.build()
+        self.assertTrue(built)
+        self.assertEqual(autocorrect.find_suggestions('helo')[0], 'hello')
+        self.assertEqual(os.listdir(temp_dir), [])
+
+
+class CloseWordsTest(unittest.TestCase):
+    """The delete index must find every word a full scan finds"""
+    
+    def setUp(self):
+        self.autocorrect = SimpleBrailleAutocorrect(cache_path=None)
+    
+    def check(self, query):
+        max_distance = braille01._max_distance(query)
+        expected = {}
+        for dict_word in self.autocorrect.dictionary:
+            # Skipping words whose length alone rules them out keeps this fast
+            if abs(len(dict_word) - len(query)) > max_distance:
+                continue
+            distance = plain_distance(query, dict_word)
+            if distance <= max_distance:
+                expected[dict_word] = distance
+        found = self.autocorrect._close_words(query, max_distance)
+        self.assertEqual(dict(found), expected, query)
+        self.assertEqual(len(found), len(expected), query)
+    
+    def test_basic_words(self):
+        for typo in make_typos(count=500, seed=5):
+            self.check(typo)
+    
+    def test_added_long_words(self):
+        # Added words longer than PREFIX_LENGTH, queried with edits both
+        # inside and after the indexed prefix
+        rng = random.Random(6)
+        added = [random_word(rng, rng.randint(8, 30), 'abcd') for _ in range(100)]
+        added += [random_word(rng, 100, 'abcd') for _ in range(5)]
+        for word in added:
+            self.autocorrect.add_word(word)
+        
+        for _ in range(200):
+            query = edit(rng, rng.choice(added), rng.randint(0, 4))
+            self.check(query)
+    
+    def test_long_queries(self):
+        rng = random.Random(7)
+        self.autocorrect.add_word('a' * 40)
+        for length in (30, 38, 40, 42, 43, 44, 60, 200):
+            self.check('a' * length)
+            self.check(random_word(rng, length))
+
+
+class OptionalBackendTest(unittest.TestCase):
+    """Each backend must find the same close words as the per-word search"""
+    
+    def setUp(self):
+        self.autocorrect = SimpleBrailleAutocorrect(cache_path=None)
+        self.typos = make_typos()
+    
+    def check_batch_matches_per_word(self):
+        batch = self.autocorrect._close_words_batch(self.typos)
+        for typo, close_words in zip(self.typos, batch):
+            expected = self.autocorrect._close_words(typo, braille01._max_distance(typo))
+            self.assertEqual(sorted(close_words), sorted(expected), typo)
+    
+    @unittest.skipIf(braille01.process is None or braille01.np is None,
+                     'rapidfuzz and numpy are not installed')
+    def test_rapidfuzz_batch(self):
+        self.check_batch_matches_per_word()
+    
+    @unittest.skipIf(braille01._batch_lev is None, 'numba is not installed')
+    def test_numba_batch(self):
+        with mock.patch.object(braille01, 'process', None):
+            self.check_batch_matches_per_word()
+    
+    @unittest.skipIf(braille01.Levenshtein is None, 'rapidfuzz is not installed')
+    def test_rapidfuzz_distance(self):
+        rng = random.Random(1)
+        for _ in range(2000):
+            word1 = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 9)))
+            word2 = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 9)))
+            max_distance = rng.choice([None, 0, 1, 2, 3])
+            fast = self.autocorrect.calculate_similarity(word1, word2, max_distance)
+            with mock.patch.object(braille01, 'Levenshtein', None):
+                slow = self.autocorrect.calculate_similarity(word1, word2, max_distance)
+            self.assertEqual(fast, slow, (word1, word2, max_distance))
+    
+    def test_batch_suggestions_match_per_word(self):
+        batch = self.autocorrect.find_suggestions_batch(self.typos, 3)
+        for typo in self.typos:
+            self.assertEqual(batch[typo], self.autocorrect.find_suggestions(typo, 3), typo)
+    
+    def test_batch_without_backend_goes_word_by_word(self):
+        with mock.patch.object(braille01, 'process', None), \
+             mock.patch.object(braille01, '_batch_lev', None), \
+             mock.patch.object(SimpleBrailleAutocorrect, '_close_words_batch') as batch:
+            results = self.autocorrect.find_suggestions_batch(self.typos, 3)
+        self.assertFalse(batch.called)
+        for typo in self.typos:
+            self.assertEqual(results[typo], self.autocorrect.find_suggestions(typo, 3), typo)
+    
+
+
+class AutocorrectTest(unittest.TestCase):
+    def setUp(self):
+        self.autocorrect = SimpleBrailleAutocorrect(cache_path=None)
+    
+    def test_long_text_uses_suggestion_cache(self):
+        # Long texts go word by word too, so repeating one is all cache hits.
+        # None of the words holds a Braille key.
+        words = ['the', 'teh', 'hell', 'thre', 'hs', 'tha', 'yer', 'sae', 'mae', 'finx']
+        text = ' '.join(words)
+        first = self.autocorrect.autocorrect(text)
+        hits = self.autocorrect._cached_suggestions.cache_info().hits
+        self.assertEqual(self.autocorrect.autocorrect(text), first)
+        # 'the' is a dictionary word and never reaches the cache
+        self.assertEqual(self.autocorrect._cached_suggestions.cache_info().hits - hits,
+                         len(words) - 1)
+        self.assertEqual([result['suggestions'] for result in first],
+                         [self.autocorrect.find_suggestions(word, 3) for word in words])
+        self.assertEqual([result['best_match'] for result in first],
+                         ['the', 'tell', 'hello', 'the', 'has', 'the', 'year', 'same',
+                          'made', 'find'])
+
+
+if __name__ == '__main__':
+    unittest.main()